@@ -4,9 +4,23 @@
 Enhanced version with better title extraction and TV show support
 """
 import os, re, time, datetime
-import requests, cloudscraper, json
-import urllib.parse
-from bs4 import BeautifulSoup
+import asyncio
+import concurrent.futures
+import gzip
+import hashlib
+import html
+import logging
+import pickle
+import requests, cloudscraper
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import lxml.html
+from lxml import etree
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from functools import lru_cache
 from urllib.parse import urljoin, parse_qs, urlparse
 
 
@@ -20,73 +34,172 @@ MIRRORS = ["https://www.1tamilmv.fi",
           "https://www.1tamilmv.legal"]
 MAX_ENTRIES = 200  # Increased for more content
 DEEP_CRAWL_TV = True  # Set to True to crawl TV show sections deeper
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+CONCURRENT_FETCHES = 16  # Max simultaneous topic-page downloads
+CACHE_DIR = ".cache"  # On-disk topic-page cache shared across runs
+CACHE_TTL = 7 * 24 * 3600  # Topic pages are effectively immutable once posted
+DOMAIN_CACHE_FILE = ".last_domain"  # Remember the working mirror between runs
+TV_CATEGORY_CACHE = os.path.join(CACHE_DIR, "tv_categories.json")
+TV_CATEGORY_TTL = 24 * 3600  # Forum sections barely change day to day
+COOKIE_FILE = ".cookies.pkl"  # Reuse the Cloudflare clearance between runs
+
+# Per-topic logging is debug-only: printing for every topic costs real time
+# over 200 items. Set MAGNET_VERBOSE=1 to get the old chatty output back.
+logging.basicConfig(
+    format="%(message)s",
+    level=logging.DEBUG if os.environ.get("MAGNET_VERBOSE") else logging.WARNING,
+)
+logger = logging.getLogger(__name__)
 
 # ─── Initialize scraper with browser emulation ────────────────────────────────
 scraper = cloudscraper.create_scraper(
     browser={
-        'custom': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+        'custom': USER_AGENT
     }
 )
 
+# Widen the default urllib3 pool (10 connections) and retry transient
+# gateway errors so keep-alive connections survive the whole crawl
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+scraper.mount('https://', _adapter)
+scraper.mount('http://', _adapter)
+scraper.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate, br"})
+
+# A still-valid cf_clearance cookie lets the first request skip the
+# cloudscraper JS-challenge solve entirely
+try:
+    with open(COOKIE_FILE, "rb") as _f:
+        scraper.cookies.update(pickle.load(_f))
+except Exception:
+    pass
+
+def save_cookies():
+    try:
+        with open(COOKIE_FILE, "wb") as f:
+            pickle.dump(scraper.cookies, f)
+    except Exception as e:
+        logger.warning(f"Could not persist cookies: {e}")
+
 # ─── Find working domain ────────────────────────────────────────────────────
 def get_domain():
     print("Attempting to find a working domain...")
-    
-    for d in MIRRORS:
-        if check_domain(d): return d
-            
+
+    # Try the mirror that worked last run before probing the whole list
+    try:
+        with open(DOMAIN_CACHE_FILE) as f:
+            last = f.read().strip()
+    except OSError:
+        last = ""
+    if last and check_domain(last):
+        return last
+
+    # Probe every mirror at once and take the first that answers; serial
+    # probing stalled for a full timeout per dead mirror. No `with` block:
+    # the context manager would join every worker on exit, making the return
+    # wait on the slowest probe instead of the fastest
+    candidates = [d for d in MIRRORS if d != last]
+    ex = concurrent.futures.ThreadPoolExecutor(max_workers=len(candidates))
+    futures = {ex.submit(check_domain, d): d for d in candidates}
+    for fut in concurrent.futures.as_completed(futures):
+        if fut.result():
+            winner = futures[fut]
+            # Still-running losers drain in the background
+            ex.shutdown(wait=False, cancel_futures=True)
+            try:
+                with open(DOMAIN_CACHE_FILE, "w") as f:
+                    f.write(winner)
+            except OSError:
+                pass
+            return winner
+
+    ex.shutdown(wait=False)
     raise RuntimeError("no mirror alive")
 
 def check_domain(url):
     try:
         print(f"\nTrying domain: {url}")
-        r = scraper.get(url, timeout=15)
+        # Cheap HEAD first — dead mirrors fail here without any body transfer
+        r = scraper.head(url, timeout=10, allow_redirects=True)
         print(f"Response: Status {r.status_code}")
-        
+
         if r.status_code != 200:
             return False
-            
-        if "1TamilMV" in r.text or "Tamil Movie" in r.text:
+
+        # Signature check only needs the start of the homepage
+        r = scraper.get(url, timeout=15, headers={'Range': 'bytes=0-65535'}, stream=True)
+        chunk = next(r.iter_content(65536), b'') or b''
+        r.close()
+
+        if b"1TamilMV" in chunk or b"Tamil Movie" in chunk:
             print("✓ Found valid homepage")
             return True
-        
+
         print("✗ Not a valid homepage")
         return False
-        
+
     except Exception as e:
         print(f"Error checking {url}: {str(e)}")
         return False
 
 # ─── Helper functions for content extraction ────────────────────────────────
-def extract_proper_title(full_title, soup=None, page_url=""):
+# Technical-spec noise stripped from titles, fused into one alternation so each
+# title is scanned once instead of once per pattern
+_TITLE_CLEAN_RE = re.compile(
+    r'\[\d+p.*?\]'          # [1080p & 720p...]
+    r'|\(BluRay.*?\)'       # (BluRay...)
+    r'|\(WEB-DL.*?\)'       # (WEB-DL...)
+    r'|- \[.*?\]$'          # - [TAM + TEL...]
+    r'|\s+-\s+\d+(?:\.\d+)?GB.*'  # - 2.7GB...
+    r'|(?:WEB-DL|BluRay|AVC|HEVC).*$'  # codec/source tag and everything after
+    r'|\s+\[.*?\]$'         # [anything] at the end
+)
+# Shared title patterns, compiled once instead of per call
+_MOVIE_YEAR_RE = re.compile(r'([^(]+)\s*\((\d{4})\)')
+_SITE_SUFFIX_RE = re.compile(r'\s*[-|]\s*(?:1TamilMV|TamilMV).*$')
+_TV_RE = re.compile(r'([^(]+)\s*\((\d{4})\)\s+S(\d+)\s+EP\s*\(?(\d+(?:-\d+)?)\)?', re.IGNORECASE)
+_TV_ALT_RE = re.compile(r'(.+?)(?:\s*\(\d{4}\))?\s+S(\d+)[Ee](\d+)', re.IGNORECASE)
+_YEAR_PAREN_RE = re.compile(r'\((\d{4})\)')
+# Pre-compiled XPath evaluators; tree.xpath(str) re-parses the expression on
+# every call, etree.XPath compiles it once at import
+_XP_UI_TITLES = etree.XPath('//*[contains(@class, "ipsType_pagetitle")]'
+                            ' | //*[contains(@class, "ipsDataItem_title")]//a')
+_XP_HEADINGS = etree.XPath('//h1 | //h2 | //*[contains(@class, "ipsType_break")]')
+# Known UI elements and site branding, fused into one alternation so the gate
+# is a single scan of the title instead of one substring search per marker
+# ("JARVIS" also covers "J.A.R.V.I.S." via its dotted variant)
+_UI_ELEMENT_RE = re.compile(
+    r'Sign In|J\.A\.R\.V\.I\.S\.|JARVIS|By Olan|Login|Register'
+    r'|TamilMV Official|1TamilMV\.com'
+)
+def extract_proper_title(full_title, tree=None, page_url=""):
     """Enhanced title extraction with better UI element filtering"""
-    # Skip known UI elements and site branding
-    ui_elements = [
-        "Sign In", "J.A.R.V.I.S.", "JARVIS", "By J.A.R.V.I.S.", "By Olan",
-        "Login", "Register", "TamilMV Official Telegram Channel",
-        "TamilMV Official", "1TamilMV.com"
-    ]
-    
     # Check if this is a UI element rather than a content title
-    if any(ui in full_title for ui in ui_elements):
+    if _UI_ELEMENT_RE.search(full_title):
         # Try to extract the real title from page elements instead
-        if soup:
+        if tree is not None:
             # Look for topic titles in the standard forum layout
-            topic_title = soup.select_one(".ipsType_pagetitle") or soup.select_one(".ipsDataItem_title a")
-            if topic_title and len(topic_title.text.strip()) > 5:
-                return topic_title.text.strip()
-            
+            topic_titles = _XP_UI_TITLES(tree)
+            if topic_titles:
+                topic_title = topic_titles[0].text_content().strip()
+                if len(topic_title) > 5:
+                    return topic_title
+
             # Look for page titles with year pattern (very reliable for movies)
-            for element in soup.select("h1, h2, .ipsType_break"):
-                text = element.text.strip()
-                movie_year = re.search(r'([^(]+)\s*\((\d{4})\)', text)
+            for element in _XP_HEADINGS(tree):
+                text = element.text_content().strip()
+                movie_year = _MOVIE_YEAR_RE.search(text)
                 if movie_year and len(movie_year.group(1).strip()) > 3:
                     return movie_year.group(0).strip()
-                    
+
             # Try page title (remove site name)
-            if soup.title:
-                title_text = soup.title.text.strip()
-                title_text = re.sub(r'\s*[-|]\s*(?:1TamilMV|TamilMV).*$', '', title_text)
+            page_title = tree.findtext('.//title')
+            if page_title:
+                title_text = page_title.strip()
+                title_text = _SITE_SUFFIX_RE.sub('', title_text)
                 if len(title_text) > 5:
                     return title_text
         
@@ -121,7 +234,7 @@ def extract_proper_title(full_title, soup=None, page_url=""):
             break
     
     # Special TV show episode pattern: Office (2025) S01 EP (37-40)
-    tv_match = re.search(r'([^(]+)\s*\((\d{4})\)\s+S(\d+)\s+EP\s*\(?(\d+(?:-\d+)?)\)?', full_title, re.IGNORECASE)
+    tv_match = _TV_RE.search(full_title)
     if tv_match:
         show_name = tv_match.group(1).strip()
         year = tv_match.group(2)
@@ -130,7 +243,7 @@ def extract_proper_title(full_title, soup=None, page_url=""):
         return f"{show_name} (S{season}E{episode})"
     
     # Handle movie titles with year in parentheses - very common pattern
-    movie_year_match = re.search(r'([^(]+)\s*\((\d{4})\)', full_title)
+    movie_year_match = _MOVIE_YEAR_RE.search(full_title)
     if movie_year_match:
         movie_name = movie_year_match.group(1).strip()
         year = movie_year_match.group(2)
@@ -138,43 +251,29 @@ def extract_proper_title(full_title, soup=None, page_url=""):
             return f"{movie_name} ({year})"
     
     # Check if there's a title in the page HTML
-    if soup:
+    if tree is not None:
         # Try page heading or title
-        heading = soup.find('h1') or soup.find('h2')
-        if heading:
-            heading_text = heading.text.strip()
+        heading = tree.find('.//h1')
+        if heading is None:
+            heading = tree.find('.//h2')
+        if heading is not None:
+            heading_text = heading.text_content().strip()
             # Look for movie name with year pattern
-            movie_year = re.search(r'([^(]+)\s*\((\d{4})\)', heading_text)
+            movie_year = _MOVIE_YEAR_RE.search(heading_text)
             if movie_year:
                 return movie_year.group(0)
-            
+
         # Try meta title tag
-        page_title = soup.find('title')
+        page_title = tree.findtext('.//title')
         if page_title:
-            title_text = page_title.text.strip()
+            title_text = page_title.strip()
             # Remove site name
-            title_text = re.sub(r'\s*[-|]\s*1TamilMV.*$', '', title_text)
-            title_text = re.sub(r'\s*[-|]\s*TamilMV.*$', '', title_text)
+            title_text = _SITE_SUFFIX_RE.sub('', title_text)
             if len(title_text) > 5:
                 return title_text
     
     # Regular removal of technical specs
-    patterns = [
-        r'\[\d+p.*?\]',  # [1080p & 720p...]
-        r'\(BluRay.*?\)',  # (BluRay...)
-        r'\(WEB-DL.*?\)',  # (WEB-DL...)
-        r'- \[.*?\]$',    # - [TAM + TEL...]
-        r'\s+-\s+\d+(\.\d+)?GB.*',  # - 2.7GB...
-        r'WEB-DL.*$',     # WEB-DL and after
-        r'BluRay.*$',     # BluRay and after
-        r'\s+\[.*?\]$',   # [anything] at the end
-        r'AVC.*$',        # AVC and after
-        r'HEVC.*$',       # HEVC and after
-    ]
-    
-    title = full_title
-    for pattern in patterns:
-        title = re.sub(pattern, '', title).strip()
+    title = _TITLE_CLEAN_RE.sub('', full_title).strip()
     
     # If title is empty or still looks like a channel name
     if not title or len(title) < 5 or title in common_prefixes:
@@ -204,59 +303,62 @@ def extract_proper_title(full_title, soup=None, page_url=""):
     return title
 
 
-def find_better_image(soup, title, dom):
+# Image-candidate filtering done entirely in lxml's C-side XPath engine:
+# prefer poster-sized or poster-named images, then fall back to anything that
+# is not a gif/avatar. _SRC_LC lowercases @src for the substring checks.
+_SRC_LC = 'translate(@src, "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")'
+_IMG_PRIMARY_XPATH = (
+    f'//img[@src and not(contains({_SRC_LC}, ".gif"))'
+    f' and not(contains({_SRC_LC}, "avatar"))'
+    f' and not(contains({_SRC_LC}, "icon"))'
+    f' and not(contains({_SRC_LC}, "logo"))'
+    f' and ((number(@width) >= 200 and number(@height) >= 200)'
+    f'      or contains({_SRC_LC}, "poster")'
+    f'      or contains({_SRC_LC}, "cover")'
+    f'      or contains({_SRC_LC}, "movie"))]/@src'
+)
+_XP_IMG_PRIMARY = etree.XPath(_IMG_PRIMARY_XPATH)
+_IMG_FALLBACK_XPATH = (
+    f'//img[@src and not(contains({_SRC_LC}, ".gif"))'
+    f' and not(contains({_SRC_LC}, "avatar"))]/@src'
+)
+_XP_IMG_FALLBACK = etree.XPath(_IMG_FALLBACK_XPATH)
+
+def find_better_image(tree, dom):
     """Find a better image for the content"""
-    # Look for poster-sized images first (movie posters are usually larger)
-    for img in soup.find_all("img"):
-        src = img.get("src", "")
-        width = img.get("width", "0")
-        height = img.get("height", "0")
-        
-        # Skip small images, icons, avatars
-        if (src and 
-            not src.endswith(('.gif')) and 
-            not 'avatar' in src.lower() and 
-            not 'icon' in src.lower() and
-            not 'logo' in src.lower()):
-            
-            # Check if image has decent dimensions if specified
-            if width.isdigit() and height.isdigit():
-                if int(width) >= 200 and int(height) >= 200:
-                    return urljoin(dom, src)
-                    
-            # Also check image filename for keywords
-            if 'poster' in src.lower() or 'cover' in src.lower() or 'movie' in src.lower():
-                return urljoin(dom, src)
-    
-    # Fallback to any larger image
-    for img in soup.find_all("img"):
-        src = img.get("src", "")
-        if src and not src.endswith(('.gif')) and not 'avatar' in src.lower():
-            return urljoin(dom, src)
-            
+    if tree is not None:
+        # Poster-sized images first (movie posters are usually larger)
+        candidates = _XP_IMG_PRIMARY(tree) or _XP_IMG_FALLBACK(tree)
+        if candidates:
+            return _join(dom, candidates[0])
+
     # Placeholder if no image found
     return "https://via.placeholder.com/300x450?text=No+Image"
 
+_LANG_RE = re.compile(r'\b(Tamil|TAM|Telugu|TEL|Hindi|HIN|Kannada|KAN|Malayalam|MAL|English|ENG|Japanese|JAP)\b')
+_LANG_MAP = {
+    "Tamil": "TAM", "TAM": "TAM",
+    "Telugu": "TEL", "TEL": "TEL",
+    "Hindi": "HIN", "HIN": "HIN",
+    "Kannada": "KAN", "KAN": "KAN",
+    "Malayalam": "MAL", "MAL": "MAL",
+    "English": "ENG", "ENG": "ENG",
+    "Japanese": "JAP", "JAP": "JAP"
+}
+
 def extract_languages(title):
     """Extract language information from the title"""
     languages = []
-    lang_patterns = {
-        "TAM": ["Tamil", "TAM"],
-        "TEL": ["Telugu", "TEL"],
-        "HIN": ["Hindi", "HIN"],
-        "KAN": ["Kannada", "KAN"],
-        "MAL": ["Malayalam", "MAL"],
-        "ENG": ["English", "ENG"],
-        "JAP": ["Japanese", "JAP"]
-    }
-    
-    for lang_code, patterns in lang_patterns.items():
-        for pattern in patterns:
-            if pattern in title:
-                languages.append(lang_code)
-                
+    for match in _LANG_RE.findall(title):
+        code = _LANG_MAP[match]
+        if code not in languages:
+            languages.append(code)
     return languages
 
+# Both TV patterns require an S-followed-by-digit marker; this tiny sniff
+# lets plain movie titles skip the two heavyweight searches entirely
+_TV_SNIFF_RE = re.compile(r'S\d', re.IGNORECASE)
+
 def extract_tv_info(title):
     """Extract season and episode information"""
     info = {
@@ -266,9 +368,12 @@ def extract_tv_info(title):
         "episode": "",
         "year": ""
     }
-    
+
+    if not _TV_SNIFF_RE.search(title):
+        return info
+
     # Look for standard TV pattern: Show Name (YYYY) SxxEPyy
-    tv_match = re.search(r'([^(]+)\s*\((\d{4})\)\s+S(\d+)\s+EP\s*\(?(\d+(?:-\d+)?)\)?', title, re.IGNORECASE)
+    tv_match = _TV_RE.search(title)
     if tv_match:
         info["is_tv_show"] = True
         info["show_name"] = tv_match.group(1).strip()
@@ -278,7 +383,7 @@ def extract_tv_info(title):
         return info
     
     # Alternative format: Show Name SxxEyy
-    alt_match = re.search(r'(.+?)(?:\s*\(\d{4}\))?\s+S(\d+)[Ee](\d+)', title, re.IGNORECASE)
+    alt_match = _TV_ALT_RE.search(title)
     if alt_match:
         info["is_tv_show"] = True
         info["show_name"] = alt_match.group(1).strip()
@@ -286,159 +391,276 @@ def extract_tv_info(title):
         info["episode"] = f"E{int(alt_match.group(3)):02d}"
         
         # Try to find year if not in the standard place
-        year_match = re.search(r'\((\d{4})\)', title)
+        year_match = _YEAR_PAREN_RE.search(title)
         if year_match:
             info["year"] = year_match.group(1)
         return info
     
     return info
 
+_QUALITY_RE = re.compile(r'1080p|720p|480p|2160p|4K|UHD|HDR')
+_QUALITY_MAP = {"2160p": "4K", "4K": "4K", "UHD": "4K"}
+_QUALITY_ORDER = ("1080p", "720p", "480p", "4K", "HDR")
+
 def extract_quality(title):
     """Extract quality information from title"""
-    qualities = []
-    if "1080p" in title:
-        qualities.append("1080p")
-    if "720p" in title:
-        qualities.append("720p")
-    if "480p" in title:
-        qualities.append("480p") 
-    if "2160p" in title or "4K" in title or "UHD" in title:
-        qualities.append("4K")
-    if "HDR" in title:
-        qualities.append("HDR")
-    
-    return qualities
+    tokens = {_QUALITY_MAP.get(t, t) for t in _QUALITY_RE.findall(title)}
+    return [q for q in _QUALITY_ORDER if q in tokens]
+
+_XP_BREADCRUMBS = etree.XPath('//*[contains(@class, "ipsBreadcrumb")]//li//a')
 
-def extract_category(soup, dom):
+def extract_category(tree, dom):
     """Extract category from breadcrumb navigation"""
     category = "Uncategorized"
     try:
-        breadcrumbs = soup.select(".ipsBreadcrumb li a")
+        breadcrumbs = _XP_BREADCRUMBS(tree)
         for crumb in breadcrumbs:
-            href = crumb.get("href", "")
+            href = crumb.get("href") or ""
             if "forum" in href:
-                return crumb.text.strip()
+                return crumb.text_content().strip()
     except:
         pass
     return category
 
+# urljoin re-parses both URLs on every call; the base is always the mirror
+# domain and hrefs repeat across widgets, so memoising pays off
+@lru_cache(maxsize=8192)
+def _join(base, ref):
+    return urljoin(base, ref)
+
+# ─── On-disk page cache ─────────────────────────────────────────────────────
+def _cache_path(url):
+    return os.path.join(CACHE_DIR, hashlib.blake2b(url.encode()).hexdigest())
+
+def cache_get(url):
+    """Return a previously fetched page (bytes) for url, or None if missing/expired"""
+    path = _cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL:
+            with open(path, "rb") as f:
+                return f.read()
+    except OSError:
+        pass
+    return None
+
+def cache_put(url, page):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(_cache_path(url), "wb") as f:
+        f.write(page)
+
 # ─── Get magnets from homepage ──────────────────────────────────────────────
-def fetch_magnets():
+# Homepage parses only ever look at links, so skip building the rest of the tree
+_LINK_STRAINER = SoupStrainer('a')
+
+# Forum topic links look like [/index.php?]/forums/topic/<id>-<slug>; anything
+# else (nav, user profiles, category pages) is a wasted fetch
+_TOPIC_HREF_RE = re.compile(r'/forums?/topic/\d+', re.I)
+
+# Streaming early-abort: once a magnet link shows up, keep reading this many
+# more bytes (sibling quality magnets sit in the same post block) and then stop.
+# Everything we extract — title, breadcrumb, poster image, magnets — appears
+# before the comment thread, which is the bulk of large pages.
+_MAGNET_SNIFF = b"magnet:?"
+MAGNET_TAIL_BYTES = 131072
+
+async def fetch_topic_page(session, link):
+    """Download a topic page, aborting early once the magnet block has passed"""
+    async with session.get(link, timeout=aiohttp.ClientTimeout(total=15)) as r:
+        buf = bytearray()
+        magnet_at = -1
+        search_from = 0
+        async for chunk in r.content.iter_chunked(16384):
+            buf += chunk
+            if magnet_at < 0:
+                magnet_at = buf.find(_MAGNET_SNIFF, search_from)
+                # Re-scan only new bytes (plus overlap) on the next chunk
+                search_from = max(0, len(buf) - len(_MAGNET_SNIFF))
+            elif len(buf) - magnet_at > MAGNET_TAIL_BYTES:
+                break
+        # Hand bytes straight to lxml: libxml2 sniffs the charset itself,
+        # skipping a Python-side decode/re-encode of every page
+        return r.status, bytes(buf)
+
+
+async def process_topic(session, sem, title, link, dom, results):
+    """Fetch a single topic page and extract its content"""
+    try:
+        logger.debug(f"Processing: {title}")
+        topic_page = cache_get(link)
+        if topic_page is None:
+            async with sem:
+                status, topic_page = await fetch_topic_page(session, link)
+            # Only cache real pages: a 403/503 or Cloudflare-challenge body
+            # has no magnet link, so caching it would make the topic look
+            # empty on every run until the CACHE_TTL expires
+            if status == 200:
+                cache_put(link, topic_page)
+
+        # No magnet in the raw bytes means nothing to extract — skip the
+        # DOM build entirely (XPath extraction still runs on the tree when
+        # magnets exist, so hrefs come back entity-decoded)
+        if _MAGNET_SNIFF not in topic_page:
+            return
+
+        topic_tree = lxml.html.fromstring(topic_page)
+
+        # Process the page and extract content
+        process_topic_page(topic_tree, title, link, dom, results)
+
+    except Exception as e:
+        logger.warning(f"Error processing topic {title}: {e}")
+
+def load_previous_items():
+    """Map link → entries from the last run's magnets.json, if present"""
+    seen = {}
+    try:
+        with open("magnets.json", "rb") as f:
+            for item in orjson.loads(f.read()):
+                seen.setdefault(item["link"], []).append(item)
+    except Exception:
+        pass
+    return seen
+
+async def fetch_magnets():
     dom = get_domain()
     results = []
-    
+    seen = load_previous_items()
+
     try:
         print(f"\nFetching recent torrents from homepage: {dom}")
-        page = scraper.get(dom, timeout=15).text
-        soup = BeautifulSoup(page, "html.parser")
-        
+        page = scraper.get(dom, timeout=15).content
+        save_cookies()
+        soup = BeautifulSoup(page, "lxml", parse_only=_LINK_STRAINER)
+
         all_links = soup.find_all('a')
         print(f"Found {len(all_links)} links on the page")
-        
-        potential_topics = []
-        for link in all_links:
-            href = link.get('href', '')
-            text = link.text.strip()
-            if text and href and not href.startswith('magnet:') and '/' in href and len(text) > 10:
-                potential_topics.append(link)
-        
+
+        potential_topics = [link for link in all_links
+                            if len(link.text.strip()) > 10
+                            and _TOPIC_HREF_RE.search(link.get('href', ''))]
+
         print(f"Found {len(potential_topics)} potential topic links")
-        
-        # Process regular topic links
-        for topic in potential_topics[:MAX_ENTRIES]:
-            title = topic.text.strip()
-            print(f"Processing: {title}")
-            link = urljoin(dom, topic.get("href"))
-            
-            try:
-                topic_page = scraper.get(link, timeout=15).text
-                topic_soup = BeautifulSoup(topic_page, "html.parser")
-                
-                # Process the page and extract content
-                process_topic_page(topic_soup, title, link, dom, results)
-                    
-            except Exception as e:
-                print(f"Error processing topic {title}: {e}")
-        
-        # Special TV show handling if enabled
-        if DEEP_CRAWL_TV:
-            # Look for TV categories
-            tv_results = find_tv_show_pages(dom)
-            
-            # Process each TV topic link
-            for tv_topic in tv_results:
-                try:
-                    print(f"Processing TV show link: {tv_topic['title']}")
-                    tv_page = scraper.get(tv_topic['link'], timeout=15).text
-                    tv_soup = BeautifulSoup(tv_page, "html.parser")
-                    
-                    # Process the page and extract content
-                    process_topic_page(tv_soup, tv_topic['title'], tv_topic['link'], dom, results)
-                        
-                except Exception as e:
-                    print(f"Error processing TV topic: {e}")
-                
+
+        # Reuse the cookies cloudscraper obtained while solving the challenge
+        sem = asyncio.Semaphore(CONCURRENT_FETCHES)
+        connector = aiohttp.TCPConnector(limit=CONCURRENT_FETCHES, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector,
+                                         cookies=scraper.cookies.get_dict(),
+                                         headers={'User-Agent': USER_AGENT}) as session:
+            # IPS homepages link each topic several times (title, last reply,
+            # thumbnail) — fetch each resolved URL only once
+            scheduled = set()
+            unique_topics = []
+            for topic in potential_topics:
+                link = _join(dom, topic.get("href"))
+                if link in scheduled:
+                    continue
+                scheduled.add(link)
+                unique_topics.append((link, topic.text.strip()))
+
+            # Process regular topic links concurrently
+            tasks = []
+            for link, title in unique_topics[:MAX_ENTRIES]:
+                # Topics scraped on a previous run are reused as-is
+                if link in seen:
+                    results.extend(seen[link])
+                    continue
+                tasks.append(process_topic(session, sem, title, link, dom, results))
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Special TV show handling if enabled
+            if DEEP_CRAWL_TV:
+                # Look for TV categories
+                tv_results = find_tv_show_pages(dom)
+
+                # Process each TV topic link concurrently
+                tv_tasks = []
+                for tv_topic in tv_results:
+                    if tv_topic['link'] in scheduled:
+                        continue
+                    scheduled.add(tv_topic['link'])
+                    if tv_topic['link'] in seen:
+                        results.extend(seen[tv_topic['link']])
+                        continue
+                    tv_tasks.append(process_topic(session, sem, tv_topic['title'], tv_topic['link'], dom, results))
+                await asyncio.gather(*tv_tasks, return_exceptions=True)
+
     except Exception as e:
         print(f"Error fetching homepage: {e}")
-    
+
     return results
 
-def process_topic_page(soup, title, link, dom, results):
+_XP_MAGNETS = etree.XPath('//a[starts-with(@href, "magnet:?")]/@href')
+_XP_SECTION_HEADS = etree.XPath('//h3 | //h4 | //strong')
+
+def process_topic_page(tree, title, link, dom, results):
     """Process a topic page and extract all content"""
     # Look for magnet links
-    magnets = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if href.startswith("magnet:?"):
-            magnets.append(href)
-    
+    magnets = _XP_MAGNETS(tree)
+    if not magnets:
+        return
+
+    # Category and poster come from the page, not the title, so resolve them
+    # once here instead of re-walking the tree for every magnet
+    category = extract_category(tree, dom)
+    img_src = find_better_image(tree, dom)
+
     # If there are multiple magnet links, need to associate each with its title
     if len(magnets) > 1:
         # Look for section titles that might indicate different qualities
-        quality_sections = soup.find_all(['h3', 'h4', 'strong'])
-        
+        quality_sections = _XP_SECTION_HEADS(tree)
+
         # If there are multiple quality sections, match them with magnets
         if len(quality_sections) >= len(magnets):
             for i, magnet in enumerate(magnets):
                 if i < len(quality_sections):
-                    section_title = quality_sections[i].text.strip()
+                    section_title = quality_sections[i].text_content().strip()
                     if section_title and len(section_title) > 5:
                         # Create entry with the section title
-                        create_content_entry(soup, section_title, magnet, link, dom, results)
+                        create_content_entry(tree, section_title, magnet, link, dom, results, category, img_src)
                 else:
                     # Fallback for additional magnets
-                    create_content_entry(soup, title, magnet, link, dom, results)
+                    create_content_entry(tree, title, magnet, link, dom, results, category, img_src)
         else:
             # Fallback: just use the same title for all magnets
             for magnet in magnets:
-                create_content_entry(soup, title, magnet, link, dom, results)
+                create_content_entry(tree, title, magnet, link, dom, results, category, img_src)
     elif len(magnets) == 1:
         # Single magnet link - use the page title
-        create_content_entry(soup, title, magnets[0], link, dom, results)
+        create_content_entry(tree, title, magnets[0], link, dom, results, category, img_src)
+
+# The scalar extractors each rescan the same raw title string, and the same
+# title recurs across quality sections and runs; one cached pass covers them
+# all. Callers must treat the returned dict as read-only.
+@lru_cache(maxsize=4096)
+def parse_title(title):
+    """Parse TV info, languages, qualities and date out of a raw title"""
+    tv_info = extract_tv_info(title)
+    return {
+        "tv_info": tv_info,
+        "languages": extract_languages(title),
+        "qualities": extract_quality(title),
+        "release_date": tv_info.get("year", "") or extract_date(title),
+    }
+
+# One-shot script: a single timestamp taken at startup is accurate enough for
+# every entry and avoids a clock read plus strftime per magnet
+_RUN_STAMP = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+_RUN_YEAR = _RUN_STAMP[:4]
 
-def create_content_entry(soup, title, magnet, link, dom, results):
+def create_content_entry(tree, title, magnet, link, dom, results, category, img_src):
     """Create a content entry with all metadata"""
     # Extract better title
-    clean_title = extract_proper_title(title, soup, link)
-    
-    # Get better image
-    img_src = find_better_image(soup, clean_title, dom)
-    
-    # Extract TV show info
-    tv_info = extract_tv_info(title)
-    
-    # Extract languages
-    languages = extract_languages(title)
-    
-    # Extract quality
-    qualities = extract_quality(title)
-    
-    # Extract date
-    release_date = tv_info.get("year", "") or extract_date(title)
-    
-    # Extract category
-    category = extract_category(soup, dom)
-    
+    clean_title = extract_proper_title(title, tree, link)
+
+    # Title-derived fields come from a single cached parse
+    parsed = parse_title(title)
+    tv_info = parsed["tv_info"]
+    languages = parsed["languages"]
+    qualities = parsed["qualities"]
+    release_date = parsed["release_date"]
+
     results.append({
         "title": title,
         "clean_title": clean_title,
@@ -449,73 +671,98 @@ def create_content_entry(soup, title, magnet, link, dom, results):
         "qualities": qualities,
         "category": category,
         "release_date": release_date,
-        "added": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "added": _RUN_STAMP,
         "is_tv_show": tv_info["is_tv_show"],
         "show_name": tv_info["show_name"],
         "season": tv_info["season"],
         "episode": tv_info["episode"]
     })
-    print(f"Added content: {clean_title}")
+    logger.debug(f"Added content: {clean_title}")
+
+# soup.select() re-parses its CSS selector on every call; compiling once
+# through soupsieve keeps the per-category cost to the match itself
+_SEL_TOPIC_TITLE = soupsieve.compile(".ipsDataItem_title a")
+
+def _discover_tv_categories(dom):
+    """Scan the homepage for forum categories that look like TV sections"""
+    categories = []
+    homepage = scraper.get(dom, timeout=15).content
+    home_soup = BeautifulSoup(homepage, "lxml", parse_only=_LINK_STRAINER)
+
+    # Look for forum links that might be TV categories
+    for link in home_soup.find_all("a"):
+        href = link.get("href", "")
+        text = link.text.strip()
+
+        if (href and ("tv" in href.lower() or "tv" in text.lower() or
+                     "series" in href.lower() or "series" in text.lower())):
+            categories.append({"text": text, "url": _join(dom, href)})
+    return categories
+
+def _load_tv_categories(dom):
+    """Category URLs change rarely; reuse yesterday's discovery when possible"""
+    try:
+        if time.time() - os.path.getmtime(TV_CATEGORY_CACHE) < TV_CATEGORY_TTL:
+            with open(TV_CATEGORY_CACHE, "rb") as f:
+                cached = orjson.loads(f.read())
+            if cached.get("dom") == dom:
+                return cached["categories"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    categories = _discover_tv_categories(dom)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(TV_CATEGORY_CACHE, "wb") as f:
+            f.write(orjson.dumps({"dom": dom, "categories": categories}))
+    except OSError:
+        pass
+    return categories
 
 def find_tv_show_pages(dom):
     """Find TV show pages by browsing categories"""
     results = []
     try:
-        # Look for categories like "TV Shows" or "Tamil TV"
-        homepage = scraper.get(dom, timeout=15).text
-        home_soup = BeautifulSoup(homepage, "html.parser")
-        
-        # Look for forum links that might be TV categories
-        for link in home_soup.find_all("a"):
-            href = link.get("href", "")
-            text = link.text.strip()
-            
-            if (href and ("tv" in href.lower() or "tv" in text.lower() or 
-                         "series" in href.lower() or "series" in text.lower())):
-                try:
-                    category_url = urljoin(dom, href)
-                    print(f"Found TV category: {text} at {category_url}")
-                    
-                    # Visit the category page
-                    category_page = scraper.get(category_url, timeout=15).text
-                    category_soup = BeautifulSoup(category_page, "html.parser")
-                    
-                    # Find topic links
-                    for topic_link in category_soup.select(".ipsDataItem_title a") or category_soup.find_all("a", class_="title"):
-                        topic_title = topic_link.text.strip()
-                        topic_href = urljoin(dom, topic_link.get("href", ""))
-                        
-                        if topic_title and topic_href:
-                            results.append({
-                                "title": topic_title,
-                                "link": topic_href
-                            })
-                except Exception as e:
-                    print(f"Error processing TV category {text}: {e}")
+        for category in _load_tv_categories(dom):
+            text, category_url = category["text"], category["url"]
+            try:
+                logger.debug(f"Found TV category: {text} at {category_url}")
+
+                # Visit the category page
+                category_page = scraper.get(category_url, timeout=15).content
+                category_soup = BeautifulSoup(category_page, "lxml")
+
+                # Find topic links
+                for topic_link in _SEL_TOPIC_TITLE.select(category_soup) or category_soup.find_all("a", class_="title"):
+                    topic_title = topic_link.text.strip()
+                    topic_href = _join(dom, topic_link.get("href", ""))
+
+                    if topic_title and topic_href:
+                        results.append({
+                            "title": topic_title,
+                            "link": topic_href
+                        })
+            except Exception as e:
+                logger.warning(f"Error processing TV category {text}: {e}")
     except Exception as e:
-        print(f"Error finding TV show pages: {e}")
-        
+        logger.warning(f"Error finding TV show pages: {e}")
+
     return results
 
 def extract_date(title, soup=None):
     """Extract release date from title or content"""
     # Look for year in title
-    year_match = re.search(r'\((\d{4})\)', title)
+    year_match = _YEAR_PAREN_RE.search(title)
     if year_match:
         return year_match.group(1)
         
     # Default to current year if not found
-    return datetime.datetime.now().strftime("%Y")
+    return _RUN_YEAR
 
 # ─── Generate HTML page ──────────────────────────────────────────────────
-def generate_html_page(items):
-    # Add categories dynamically
-    categories = sorted(set([item['category'] for item in items if item['category']]))
-    category_options = ""
-    for category in categories:
-        category_options += f'<option value="{category}">{category}</option>\n'
-    
-    html = """<!DOCTYPE html>
+# Static page shell, parsed once at import; %(...)s slots are filled per run.
+# Built with a parts list + join so output assembly stays linear in page size.
+_PAGE_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -526,7 +773,10 @@ def generate_html_page(items):
     <style>
         body { background-color: #f8f9fa; }
         .navbar { background-color: #343a40 !important; }
-        .card { transition: transform 0.2s; margin-bottom: 20px; height: 100%; }
+        .card { transition: transform 0.2s; margin-bottom: 20px; height: 100%%; }
+        /* Off-screen cards skip layout/paint entirely; the size hint keeps
+           the scrollbar stable without measuring them */
+        .magnet-item { content-visibility: auto; contain-intrinsic-size: auto 480px; }
         .card:hover { transform: translateY(-5px); box-shadow: 0 10px 20px rgba(0,0,0,0.1); }
         .card-img-top { height: 200px; object-fit: cover; }
         .badge { margin-right: 5px; }
@@ -545,14 +795,14 @@ def generate_html_page(items):
         <div class="container">
             <a class="navbar-brand" href="#">1TamilMV Magnet Dashboard</a>
             <div class="ms-auto text-white">
-                <small>Last updated: """ + time.strftime("%Y-%m-%d %H:%M:%S UTC") + """</small>
+                <small>Last updated: %(updated)s</small>
             </div>
         </div>
     </nav>
 
     <div class="container mt-4">
         <div class="alert alert-info">
-            <i class="fas fa-info-circle"></i> Found <span id="resultCount">""" + str(len(items)) + """</span> items. Use filters below to narrow results.
+            <i class="fas fa-info-circle"></i> Found <span id="resultCount">%(count)s</span> items. Use filters below to narrow results.
         </div>
         
         <div class="filter-bar">
@@ -575,7 +825,7 @@ def generate_html_page(items):
                 <div class="col-md-2">
                     <select class="form-select" id="categoryFilter">
                         <option value="">All Categories</option>
-                        """ + category_options + """
+                        %(category_options)s
                     </select>
                 </div>
                 <div class="col-md-2">
@@ -631,30 +881,185 @@ def generate_html_page(items):
             </div>
         </div>
 
-        <div class="row" id="magnetCards">
-"""
-
-    # Add TV shows first
-    for item in [i for i in items if i.get('is_tv_show')]:
-        html = generate_item_card(item, html)
-        
-    # Then add movies
-    for item in [i for i in items if not i.get('is_tv_show')]:
-        html = generate_item_card(item, html)
-
-    html += """
-        </div>
+        <div class="row" id="magnetCards"></div>
     </div>
+"""
 
+_PAGE_TAIL = """
     <footer class="bg-dark text-white text-center py-3 mt-5">
         <div class="container">
-            <p class="mb-0">Last updated: """ + time.strftime("%Y-%m-%d %H:%M:%S UTC") + """</p>
+            <p class="mb-0">Last updated: %(updated)s</p>
         </div>
     </footer>
 
+    <script type="application/json" id="items-data">%(items_json)s</script>
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.2.3/dist/js/bootstrap.bundle.min.js"></script>
     <script>
-        // Function to copy magnet link to clipboard
+        // Cards are rendered client-side from the embedded dataset, so
+        // filtering and sorting work on plain JS objects instead of DOM
+        // attribute reads and each item ships once (as JSON) instead of as
+        // pre-built markup.
+        const ITEMS = JSON.parse(document.getElementById('items-data').textContent);
+        // Normalise once at load so the per-keystroke filter loop does no
+        // toLowerCase/allocation work of its own
+        ITEMS.forEach((item, i) => {
+            item.idx = i;
+            // Single searchable blob: one indexOf per item instead of two
+            // includes over separately-lowercased strings
+            item.search = (item.title + '\u001f' + item.original).toLowerCase();
+            item.showLower = item.show.toLowerCase();
+            item.episodeLower = item.episode.toLowerCase();
+            item.qualitiesLower = item.qualities.map(q => q.toLowerCase());
+        });
+
+        // Inverted indices for the dropdown filters: a selected value maps
+        // straight to its candidate set, so a narrow selection means the text
+        // filters only ever scan that subset
+        const byLanguage = new Map(), byQuality = new Map(), byCategory = new Map();
+        function indexInto(map, key, idx) {
+            let set = map.get(key);
+            if (!set) map.set(key, set = new Set());
+            set.add(idx);
+        }
+        ITEMS.forEach(item => {
+            item.languages.forEach(lang => indexInto(byLanguage, lang, item.idx));
+            item.qualitiesLower.forEach(q => indexInto(byQuality, q, item.idx));
+            indexInto(byCategory, item.category, item.idx);
+        });
+
+        const QUALITY_BADGE = {
+            '1080p': 'bg-info',
+            '720p': 'bg-secondary',
+            '480p': 'bg-warning text-dark',
+            '4K': 'bg-danger'
+        };
+
+        function esc(s) {
+            return String(s).replace(/&/g, '&amp;').replace(/</g, '&lt;')
+                            .replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+        }
+
+        function renderCard(item) {
+            const image = item.image
+                ? `<img src="${esc(item.image)}" class="card-img-top" alt="${esc(item.title)}" loading="lazy">`
+                : '<div class="no-image"><span>No Image</span></div>';
+            const badges = [
+                item.tv ? '<span class="badge tv-badge">TV</span>'
+                        : '<span class="badge movie-badge">Movie</span>'
+            ];
+            for (const q of item.qualities) {
+                badges.push(`<span class="badge ${QUALITY_BADGE[q] || 'bg-warning text-dark'}">${esc(q)}</span>`);
+            }
+            for (const lang of item.languages) {
+                badges.push(`<span class="badge bg-primary language-badge">${esc(lang)}</span>`);
+            }
+            const seasonEpisode = item.tv && item.season && item.episode
+                ? ` \u2022 ${esc(item.season)} ${esc(item.episode)}` : '';
+            return `
+        <div class="col-md-3 magnet-item">
+            <div class="card h-100">
+                <div class="card-img-top-container">${image}</div>
+                <div class="card-body">
+                    <h5 class="card-title" title="${esc(item.title)}">${esc(item.title)}</h5>
+                    <div class="mb-2">${badges.join('')}</div>
+                    <p class="card-text">
+                        <small class="text-muted">${esc(item.category)}${seasonEpisode} \u2022 ${esc(item.year)}</small>
+                    </p>
+                    <div class="d-grid gap-2">
+                        <button class="btn btn-magnet text-white btn-sm copy-btn" data-idx="${item.idx}">
+                            <i class="fas fa-copy me-1"></i> Copy Magnet
+                        </button>
+                        <a href="${esc(item.magnet)}" class="btn btn-dark btn-sm">
+                            <i class="fas fa-magnet me-1"></i> Open Magnet
+                        </a>
+                        <a href="https://real-debrid.com/torrents" target="_blank" class="btn btn-realdebrid text-white btn-sm">
+                            <i class="fas fa-cloud-download-alt me-1"></i> Go to Real-Debrid
+                        </a>
+                    </div>
+                </div>
+            </div>
+        </div>`;
+        }
+
+        // One branch-free comparator per sort order, picked once per pass;
+        // both key formats (ISO-ish dates, lowercased titles) order
+        // correctly under plain < comparison
+        const COMPARATORS = {
+            newest: (a, b) => a.added < b.added ? 1 : a.added > b.added ? -1 : 0,
+            oldest: (a, b) => a.added < b.added ? -1 : a.added > b.added ? 1 : 0,
+            az: (a, b) => a.search < b.search ? -1 : a.search > b.search ? 1 : 0,
+            za: (a, b) => a.search < b.search ? 1 : a.search > b.search ? -1 : 0
+        };
+
+        // Users toggle between the same few filter combinations; remember
+        // the rendered result for recent ones so flipping back is a lookup
+        const resultCache = new Map();
+        const RESULT_CACHE_MAX = 8;
+
+        // Filter, sort and re-render in one pass over the dataset
+        function refresh() {
+            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
+            const contentType = document.getElementById('contentTypeFilter').value;
+            const categoryFilter = document.getElementById('categoryFilter').value;
+            const qualityFilter = document.getElementById('qualityFilter').value.toLowerCase();
+            const languageFilter = document.getElementById('languageFilter').value;
+            const showName = document.getElementById('showNameInput').value.toLowerCase();
+            const seasonFilter = document.getElementById('seasonFilter').value;
+            const episodeFilter = document.getElementById('episodeFilter').value.toLowerCase();
+            const yearFilter = document.getElementById('yearFilter').value;
+            const sortOrder = document.getElementById('sortOrder').value;
+
+            // Cache check comes first: a hit re-applies the stored markup
+            // before any index intersection or predicate work runs
+            const cacheKey = [searchTerm, contentType, categoryFilter, qualityFilter,
+                              languageFilter, showName, seasonFilter, episodeFilter,
+                              yearFilter, sortOrder].join('\u001f');
+            const hit = resultCache.get(cacheKey);
+            if (hit !== undefined) {
+                document.getElementById('magnetCards').innerHTML = hit.html;
+                document.getElementById('resultCount').textContent = hit.count;
+                return hit.count;
+            }
+
+            // Fast path: nothing selected means every item matches, so skip
+            // the predicate walk entirely (initial load, cleared filters)
+            const unfiltered = !searchTerm && !contentType && !categoryFilter
+                && !qualityFilter && !languageFilter && !showName
+                && !seasonFilter && !episodeFilter && !yearFilter;
+
+            // Start from the smallest indexed set when dropdowns are active
+            let candidates = ITEMS;
+            const indexed = [];
+            if (languageFilter) indexed.push(byLanguage.get(languageFilter) || new Set());
+            if (qualityFilter) indexed.push(byQuality.get(qualityFilter) || new Set());
+            if (categoryFilter) indexed.push(byCategory.get(categoryFilter) || new Set());
+            if (indexed.length) {
+                indexed.sort((a, b) => a.size - b.size);
+                candidates = [...indexed[0]]
+                    .filter(i => indexed.every(set => set.has(i)))
+                    .map(i => ITEMS[i]);
+            }
+
+            const rows = unfiltered ? ITEMS.slice() : candidates.filter(item =>
+                (!searchTerm || item.search.indexOf(searchTerm) !== -1) &&
+                (!contentType || (contentType === 'tv') === item.tv) &&
+                (!showName || item.showLower.includes(showName)) &&
+                (!seasonFilter || item.season.includes(seasonFilter)) &&
+                (!episodeFilter || item.episodeLower.includes(episodeFilter)) &&
+                (!yearFilter || item.year.includes(yearFilter)));
+
+            rows.sort(COMPARATORS[sortOrder] || COMPARATORS.newest);
+
+            const html = rows.map(renderCard).join('');
+            resultCache.set(cacheKey, {html, count: rows.length});
+            if (resultCache.size > RESULT_CACHE_MAX) {
+                resultCache.delete(resultCache.keys().next().value);
+            }
+            document.getElementById('magnetCards').innerHTML = html;
+            document.getElementById('resultCount').textContent = rows.length;
+            return rows.length;
+        }
+
         function copyToClipboard(text, button) {
             navigator.clipboard.writeText(text).then(() => {
                 const originalText = button.innerHTML;
@@ -669,291 +1074,178 @@ def generate_html_page(items):
             });
         }
 
-        // Wait for the DOM to be fully loaded
+        // Coalesce keystroke bursts: a short trailing timeout merges rapid
+        // input events, then the work runs inside one animation frame so at
+        // most one filter-and-render pass touches the DOM per frame
+        let refreshTimer = null;
+        let rafId = null;
+        function scheduleRefresh() {
+            clearTimeout(refreshTimer);
+            refreshTimer = setTimeout(() => {
+                if (rafId) return;
+                rafId = requestAnimationFrame(() => {
+                    rafId = null;
+                    refresh();
+                });
+            }, 80);
+        }
+
         document.addEventListener('DOMContentLoaded', function() {
-            console.log("DOM loaded, initializing filters...");
-            
-            // Initialize event listeners
-            document.getElementById('searchInput').addEventListener('input', debounce(filterItems, 300));
+            // Text inputs re-filter through the coalescing scheduler;
+            // selects re-filter immediately
+            for (const id of ['searchInput', 'showNameInput', 'episodeFilter', 'yearFilter']) {
+                document.getElementById(id).addEventListener('input', scheduleRefresh);
+            }
+            for (const id of ['contentTypeFilter', 'categoryFilter', 'qualityFilter',
+                              'languageFilter', 'seasonFilter', 'sortOrder']) {
+                document.getElementById(id).addEventListener('change', refresh);
+            }
+
             document.getElementById('searchButton').addEventListener('click', function() {
-                filterItems();
-                const visibleResults = document.querySelectorAll('.magnet-item:not([style*="display: none"])').length;
-                alert(`Found ${visibleResults} results matching your search criteria.`);
+                alert(`Found ${refresh()} results matching your search criteria.`);
             });
-            
-            // Add Enter key support for search
             document.getElementById('searchInput').addEventListener('keyup', function(event) {
                 if (event.key === "Enter") {
                     document.getElementById('searchButton').click();
                 }
             });
-            
-            // Add other filter event listeners
-            document.getElementById('contentTypeFilter').addEventListener('change', filterItems);
-            document.getElementById('categoryFilter').addEventListener('change', filterItems);
-            document.getElementById('qualityFilter').addEventListener('change', filterItems);
-            document.getElementById('languageFilter').addEventListener('change', filterItems);
-            document.getElementById('showNameInput').addEventListener('input', debounce(filterItems, 300));
-            document.getElementById('seasonFilter').addEventListener('change', filterItems);
-            document.getElementById('episodeFilter').addEventListener('input', debounce(filterItems, 300));
-            document.getElementById('yearFilter').addEventListener('input', debounce(filterItems, 300));
-            document.getElementById('sortOrder').addEventListener('change', sortItems);
-            
-            // Initial filter and sort
-            filterItems();
-            sortItems();
-            
-            console.log("Filters initialized");
-        });
-
-        // Debounce function to limit how often a function is called
-        function debounce(func, wait) {
-            let timeout;
-            return function() {
-                const context = this;
-                const args = arguments;
-                clearTimeout(timeout);
-                timeout = setTimeout(() => {
-                    func.apply(context, args);
-                }, wait);
-            };
-        }
 
-        // Main filtering function
-        function filterItems() {
-            console.log("Filtering items...");
-            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-            const contentType = document.getElementById('contentTypeFilter').value;
-            const categoryFilter = document.getElementById('categoryFilter').value;
-            const qualityFilter = document.getElementById('qualityFilter').value.toLowerCase();
-            const languageFilter = document.getElementById('languageFilter').value;
-            const showName = document.getElementById('showNameInput').value.toLowerCase();
-            const seasonFilter = document.getElementById('seasonFilter').value;
-            const episodeFilter = document.getElementById('episodeFilter').value.toLowerCase();
-            const yearFilter = document.getElementById('yearFilter').value;
-            
-            console.log("Search term:", searchTerm);
-            
-            let visibleCount = 0;
-            
-            // Loop through all items and filter them
-            document.querySelectorAll('.magnet-item').forEach(item => {
-                try {
-                    const title = (item.getAttribute('data-title') || "").toLowerCase();
-                    const originalTitle = (item.getAttribute('data-original-title') || "").toLowerCase();
-                    const category = item.getAttribute('data-category') || "";
-                    const languages = (item.getAttribute('data-languages') || "").split(',');
-                    const qualities = (item.getAttribute('data-qualities') || "").split(',');
-                    const isTvShow = (item.getAttribute('data-tv-show') || "false") === 'true';
-                    const showNameAttr = (item.getAttribute('data-show-name') || "").toLowerCase();
-                    const season = item.getAttribute('data-season') || "";
-                    const episode = (item.getAttribute('data-episode') || "").toLowerCase();
-                    const year = item.getAttribute('data-year') || "";
-                    
-                    // Check if item matches all filters
-                    const titleMatch = !searchTerm || title.includes(searchTerm) || originalTitle.includes(searchTerm);
-                    const contentTypeMatch = !contentType || 
-                        (contentType === 'tv' && isTvShow) || 
-                        (contentType === 'movie' && !isTvShow);
-                    const categoryMatch = !categoryFilter || category === categoryFilter;
-                    const qualityMatch = !qualityFilter || qualities.some(q => q.toLowerCase().includes(qualityFilter));
-                    const languageMatch = !languageFilter || languages.includes(languageFilter);
-                    const showNameMatch = !showName || showNameAttr.includes(showName);
-                    const seasonMatch = !seasonFilter || season.includes(seasonFilter);
-                    const episodeMatch = !episodeFilter || episode.includes(episodeFilter);
-                    const yearMatch = !yearFilter || year.includes(yearFilter);
-                    
-                    // Show or hide the item based on filter matches
-                    if (titleMatch && contentTypeMatch && categoryMatch && qualityMatch && 
-                        languageMatch && showNameMatch && seasonMatch && episodeMatch && yearMatch) {
-                        item.style.display = '';
-                        visibleCount++;
-                    } else {
-                        item.style.display = 'none';
-                    }
-                } catch (error) {
-                    console.error("Error filtering item:", error);
-                    item.style.display = ''; // Show item on error
+            // One delegated listener covers every copy button, re-renders included
+            document.getElementById('magnetCards').addEventListener('click', function(event) {
+                const button = event.target.closest('.copy-btn');
+                if (button) {
+                    copyToClipboard(ITEMS[+button.dataset.idx].magnet, button);
                 }
             });
-            
-            // Update the count display
-            document.getElementById('resultCount').textContent = visibleCount;
-            console.log(`Filtering complete. Showing ${visibleCount} items.`);
-        }
 
-        // Sorting function
-        function sortItems() {
-            console.log("Sorting items...");
-            const container = document.getElementById('magnetCards');
-            const sortOrder = document.getElementById('sortOrder').value;
-            const items = Array.from(container.getElementsByClassName('magnet-item'));
-            
-            items.sort(function(a, b) {
-                const aTitle = (a.getAttribute('data-title') || "").toLowerCase();
-                const bTitle = (b.getAttribute('data-title') || "").toLowerCase(); 
-                const aDate = a.getAttribute('data-added') || '2000-01-01';
-                const bDate = b.getAttribute('data-added') || '2000-01-01';
-                
-                switch(sortOrder) {
-                    case 'newest':
-                        return bDate.localeCompare(aDate);
-                    case 'oldest':
-                        return aDate.localeCompare(bDate);
-                    case 'az':
-                        return aTitle.localeCompare(bTitle);
-                    case 'za':
-                        return bTitle.localeCompare(aTitle);
-                    default:
-                        return 0;
-                }
-            });
-            
-            // Reappend sorted items to the container
-            items.forEach(item => container.appendChild(item));
-            console.log("Sorting complete");
-        }
+            refresh();
+        });
     </script>
 </body>
 </html>
 """
-    return html
-
-
-def generate_item_card(item, html_container):
-    """Generate HTML for a single item card"""
-    title = item['title']
-    clean_title = item.get('clean_title', title) 
-    magnet = urllib.parse.quote(item['magnet'])  # URL-encode the magnet link
-    category = item.get('category', "Uncategorized")
-    img_src = item.get('image', "")
-    languages = item.get('languages', [])
-    qualities = item.get('qualities', [])
-    release_date = item.get('release_date', "")
-    added_date = item.get('added', "")
-    is_tv_show = item.get('is_tv_show', False)
-    show_name = item.get('show_name', "")
-    season = item.get('season', "")
-    episode = item.get('episode', "")
-    
-    # Create badges for quality markers
-    quality_badges = ""
-    for quality in qualities:
-        badge_class = "bg-info" if quality == "1080p" else "bg-secondary" if quality == "720p" else "bg-warning text-dark" if quality == "480p" else "bg-danger" if quality in ["4K", "2160p", "UHD"] else "bg-warning text-dark"
-        quality_badges += f'<span class="badge {badge_class}">{quality}</span>'
-        
-    # Create badges for languages
-    language_badges = ""
-    for lang in languages:
-        language_badges += f'<span class="badge bg-primary language-badge">{lang}</span>'
-    
-    # Content type badge
-    content_type_badge = f'<span class="badge tv-badge">TV</span>' if is_tv_show else f'<span class="badge movie-badge">Movie</span>'
-    
-    # Season/Episode info
-    season_episode = ""
-    if is_tv_show:
-        if season and episode:
-            season_episode = f" • {season} {episode}"
-    
-    html_content = f"""
-        <div class="col-md-3 magnet-item" 
-            data-category="{category}"
-            data-title="{clean_title.lower().replace('"', '&quot;')}" 
-            data-original-title="{title.lower().replace('"', '&quot;')}"
-            data-year="{release_date}"
-            data-added="{added_date}"
-            data-languages="{','.join(languages)}"
-            data-qualities="{','.join(qualities)}"
-            data-tv-show="{str(is_tv_show).lower()}"
-            data-show-name="{show_name.replace('"', '&quot;')}"
-            data-season="{season}"
-            data-episode="{episode}">
-            <div class="card h-100">
-                <div class="card-img-top-container">
-                    {f'<img src="{img_src}" class="card-img-top" alt="{clean_title}">' if img_src else '<div class="no-image"><span>No Image</span></div>'}
-                </div>
-                <div class="card-body">
-                    <h5 class="card-title" title="{clean_title}">{clean_title}</h5>
-                    <div class="mb-2">
-                        {content_type_badge}
-                        {quality_badges}
-                        {language_badges}
-                    </div>
-                    <p class="card-text">
-                        <small class="text-muted">{category}{season_episode} • {release_date}</small>
-                    </p>
-                    <div class="d-grid gap-2">
-                        <button class="btn btn-magnet text-white btn-sm" onclick="copyToClipboard('{magnet}', this)">
-                            <i class="fas fa-copy me-1"></i> Copy Magnet
-                        </button>
-                        <a href="{magnet}" class="btn btn-dark btn-sm">
-                            <i class="fas fa-magnet me-1"></i> Open Magnet
-                        </a>
-                        <a href="https://real-debrid.com/torrents" target="_blank" class="btn btn-realdebrid text-white btn-sm">
-                            <i class="fas fa-cloud-download-alt me-1"></i> Go to Real-Debrid
-                        </a>
-                    </div>
-                </div>
-            </div>
-        </div>
-    """
-    html_container += html_content
-    return html_container
+
+def stream_html_page(items, fp):
+    """Write the dashboard page to an open file"""
+    # One pass over the items collects categories and builds the client-side
+    # dataset, already partitioned (TV shows listed before movies). The page
+    # ships each item once as JSON and the browser renders the cards, so
+    # filtering runs over plain objects instead of DOM attribute reads.
+    categories = set()
+    tv_rows = []
+    movie_rows = []
+    for item in items:
+        if item['category']:
+            categories.add(item['category'])
+        row = {
+            "title": item.get('clean_title') or item['title'],
+            "original": item['title'],
+            "magnet": item['magnet'],
+            "image": item.get('image', ""),
+            "category": item.get('category', "Uncategorized"),
+            "languages": item.get('languages', []),
+            "qualities": item.get('qualities', []),
+            "year": item.get('release_date', ""),
+            "added": item.get('added', ""),
+            "tv": bool(item.get('is_tv_show')),
+            "show": item.get('show_name', ""),
+            "season": item.get('season', ""),
+            "episode": item.get('episode', ""),
+        }
+        (tv_rows if row["tv"] else movie_rows).append(row)
+
+    # A literal "</" inside a <script> block would end it early
+    items_json = orjson.dumps(tv_rows + movie_rows).replace(b"</", b"<\\/").decode()
+
+    # Categories come straight from scraped breadcrumbs; an unescaped quote
+    # would truncate the value attribute and the filter could never match.
+    # The browser decodes entities when reading option.value, so the JS
+    # index keys still line up
+    category_options = "\n".join(
+        '<option value="{0}">{0}</option>'.format(html.escape(category, quote=True))
+        for category in sorted(categories))
+
+    updated = time.strftime("%Y-%m-%d %H:%M:%S UTC")
+    fp.write(_PAGE_HEAD % {
+        "updated": updated,
+        "count": len(items),
+        "category_options": category_options,
+    })
+    fp.write(_PAGE_TAIL % {"updated": updated, "items_json": items_json})
+
+
+# The info hash identifies the torrent itself; the same torrent can be posted
+# with different tracker lists or display names, so keying dedup on the full
+# magnet URI misses real duplicates
+_XT_RE = re.compile(r'xt=urn:btih:([A-Za-z0-9]+)')
 
 def remove_duplicates(items):
     """Remove duplicate entries based on magnet links"""
     print("Removing duplicate entries...")
-    
-    # Use dictionary to track unique magnet links
+
+    # Use dictionary to track unique torrents, keyed by info hash where present
     unique_items = {}
     duplicate_count = 0
-    
+
     for item in items:
         magnet_link = item['magnet']
-        
-        # If we haven't seen this magnet link before, add it
-        if magnet_link not in unique_items:
-            unique_items[magnet_link] = item
+        xt = _XT_RE.search(magnet_link)
+        key = xt.group(1).lower() if xt else magnet_link
+
+        # If we haven't seen this torrent before, add it
+        if key not in unique_items:
+            unique_items[key] = item
         else:
             duplicate_count += 1
             # If this item has a better title than the existing one, replace it
-            if len(item.get('clean_title', '')) > len(unique_items[magnet_link].get('clean_title', '')):
-                unique_items[magnet_link] = item
-    
-    # Check for similar titles with different magnet links
-    similar_titles = {}
-    for magnet, item in unique_items.items():
-        clean_title = item.get('clean_title', '').lower()
-        if len(clean_title) > 5:
-            title_key = clean_title[:10]  # First 10 chars as key
-            if title_key in similar_titles:
-                similar_titles[title_key].append(magnet)
-            else:
-                similar_titles[title_key] = [magnet]
+            if len(item.get('clean_title', '')) > len(unique_items[key].get('clean_title', '')):
+                unique_items[key] = item
     
     print(f"Removed {duplicate_count} duplicate entries")
     return list(unique_items.values())
 
 
 # ─── Save data to JSON and HTML ──────────────────────────────────────────────
-def save_data(items):
-    # Save JSON data
-    with open("magnets.json", "w", encoding="utf-8") as f:
-        json.dump(items, f, indent=2, ensure_ascii=False)
+def _write_json(items):
+    # Compact form: the file is a machine-read sidecar (cross-run reuse and
+    # any API consumers), and dropping the indent roughly halves it
+    with open("magnets.json", "wb") as f:
+        f.write(orjson.dumps(items))
     print(f"Saved JSON data to magnets.json")
-    
-    # Generate and save HTML
-    html = generate_html_page(items)
-    with open("index.html", "w", encoding="utf-8") as f:
-        f.write(html)
+
+def _write_html(items):
+    with open("index.html", "w", encoding="utf-8", buffering=1 << 20) as f:
+        stream_html_page(items, f)
     print(f"Saved HTML dashboard to index.html")
+    _precompress("index.html")
+
+def _precompress(path):
+    """Write .gz/.br siblings so static hosts can serve precompressed"""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        with open(path + ".gz", "wb") as f:
+            f.write(gzip.compress(raw, compresslevel=9))
+        try:
+            import brotli
+            with open(path + ".br", "wb") as f:
+                f.write(brotli.compress(raw, quality=11))
+        except ImportError:
+            pass
+    except OSError as e:
+        logger.warning(f"Could not precompress {path}: {e}")
+
+def save_data(items):
+    # The two outputs are independent, so let their disk I/O overlap
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        for fut in [ex.submit(_write_json, items), ex.submit(_write_html, items)]:
+            fut.result()
 
 
 # ─── Main function ──────────────────────────────────────────────────────────
 def main():
     print(f"Starting magnet dashboard update at {datetime.datetime.now()}")
-    items = fetch_magnets()
+    items = asyncio.run(fetch_magnets())
     print(f"\nFound {len(items)} items with potential duplicates")
     
     # Remove duplicates